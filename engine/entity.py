@@ -14,6 +14,9 @@ from engine.util import min_max
 
 T = TypeVar('T', bound='Entity')
 
+# The width/height of a spatial index bucket, expressed as a bit shift (32x32 px).
+INDEX_CELL_SHIFT = 5
+
 
 @total_ordering
 class Entity(ABC):
@@ -22,6 +25,8 @@ class Entity(ABC):
     An entity is anything that can be drawn to the screen.
     """
 
+    __slots__ = ('_id', '_loc', '_dirty', '_loaded', '_visible', '_removed', '_should_remove', '_priority')
+
     def __init__(self, loc: Location | None = None, priority: int = 0):
         self._id = uuid.uuid4()
         self._loc = loc if loc else Location(0, 0)
@@ -97,6 +102,17 @@ class Entity(ABC):
         """
         pass
 
+    def _on_remove(self) -> None:
+        """
+        Called by the EntityHandler once the Entity has actually been removed from
+        its list. Pooled entities override this to return themselves to their pool.
+
+        Optional method.
+
+        :return: None
+        """
+        pass
+
     # Properties
 
     @property
@@ -239,6 +255,25 @@ class Entity(ABC):
         """
         self._dirty = False
 
+    def _reset(self, loc: Location, priority: int = 0) -> None:
+        """
+        Restores the Entity to its pre-spawn state so a pooled instance can be reused.
+
+        Subclasses reusing entities must re-initialize their own fields on top of this.
+
+        :param loc: The location the entity will respawn at.
+        :param priority: The render priority of the reused entity.
+        :return: None
+        """
+        self._id = uuid.uuid4()
+        self._loc = loc
+        self._dirty = True
+        self._loaded = False
+        self._visible = False
+        self._removed = False
+        self._should_remove = False
+        self._priority = priority
+
     def clicked_on(self, mouse_pos: tuple[int, int]) -> bool:
         """
         Checks if the Entity was clicked on, given the mouse position.
@@ -264,17 +299,34 @@ class Entity(ABC):
         :param radius: The maximum distance the entities can be, before being excluded.
         :return: A list of nearby entities within the given radius.
         """
-        return [e for e in engine.entity_handler.entities if e.location.dist(self.location) <= radius]
+        radius_sqr = radius * radius
+        return [e for e in engine.entity_handler.entities if e._loc.dist_sqr(self._loc) <= radius_sqr]
 
     def nearby_entities_type(self, radius: float, t: Type[T]) -> list[T]:
         """
         Gets a list of nearby entities within the given radius and of type t.
 
+        Served by the handler's per-type spatial index rather than a scan of the
+        full entity list; results may lag spawns by at most one tick.
+
         :param radius: The maximum distance the entities can be, before being excluded.
         :param t: The type of the entities to look for.
         :return: A list of nearby entities within the given radius and of type t.
         """
-        return [e for e in engine.entity_handler.entities if e._loc.dist(self._loc) <= radius and isinstance(e, t)]
+        return engine.entity_handler.query_nearby(self._loc, radius, t)
+
+    def first_nearby_entity_type(self, radius: float, t: Type[T]) -> 'T | None':
+        """
+        Gets the first entity found within the given radius and of type t.
+
+        Unlike `nearby_entities_type`, this short-circuits on the first hit instead
+        of building the full list; use it when any single target will do.
+
+        :param radius: The maximum distance the entity can be, before being excluded.
+        :param t: The type of the entity to look for.
+        :return: The first entity found within the given radius, or None.
+        """
+        return engine.entity_handler.first_nearby(self._loc, radius, t)
 
     def nearest_entity(self) -> 'Entity | None':
         nearest: Entity | None = None
@@ -301,6 +353,8 @@ class Entity(ABC):
 
 class HealthBar(Entity):
 
+    __slots__ = ('_entity', '_w', '_h')
+
     def __init__(self, entity: 'LivingEntity', *, w: int = 50, h: int = 6):
         super().__init__()
         self._entity = entity
@@ -322,6 +376,9 @@ class HealthBar(Entity):
 
 class LivingEntity(Entity):
 
+    __slots__ = ('_health', '_max_health', '_velocity', '_health_bar', '_bound_to_screen',
+                 '_invincible', '_invincible_frames')
+
     def __init__(self,
                  priority: int = 0,
                  *,
@@ -421,22 +478,30 @@ class LivingEntity(Entity):
     def invincible_frames(self, value: int) -> None:
         self._invincible_frames = max(0, value)
 
-    @property
-    @abstractmethod
-    def max_health(self) -> int:
-        pass
+    # subclasses override this class attribute with their own maximum
+    max_health: int = 0
 
-    @abstractmethod
     def _on_damage(self) -> None:
-        pass
+        """
+        Called when this entity takes damage. No-op by default.
+
+        :return: None.
+        """
 
-    @abstractmethod
     def _on_heal(self) -> None:
-        pass
+        """
+        Called when this entity is healed. No-op by default.
+
+        :return: None.
+        """
 
-    @abstractmethod
     def _on_death(self) -> None:
-        pass
+        """
+        Called when this entity's health reaches zero. No-op by default.
+
+        :return: None.
+        """
+
 
 
 class EntityHandler:
@@ -448,6 +513,7 @@ class EntityHandler:
         self._entities: list[Entity] = []
         self._despawn_offscreen = False
         self._safe_rect: Rect | None = None
+        self._type_indexes: dict[Type[Entity], dict[tuple[int, int], list[Entity]]] = {}
 
     def tick(self, tick_count: int) -> None:
         """
@@ -462,15 +528,23 @@ class EntityHandler:
         if self._check_dirty():
             self._entities.sort()
 
+        # single pass: tick survivors and compact removals in place, instead of
+        # O(n) list.remove calls while iterating (which also skipped the entity
+        # following each removal)
+        survivors = []
         for entity in self._entities:
             if self._despawn_offscreen:
                 if not self._safe_rect.colliderect(entity.bounds()):
                     entity.dispose()
             if entity.should_remove():
-                self._entities.remove(entity)
-                del entity
+                entity._removed = True
+                entity._on_remove()
                 continue
+            survivors.append(entity)
             entity.tick(tick_count)
+        self._entities[:] = survivors
+
+        self._rebuild_type_indexes()
 
     def draw(self, surface: Surface) -> None:
         """
@@ -563,6 +637,192 @@ class EntityHandler:
         """
         return [e for e in self._entities if isinstance(e, entity_type)]
 
+    def has_any(self, entity_type: Type[Entity]) -> bool:
+        """
+        Cheaply checks whether any Entity of type `entity_type` is registered at all.
+
+        An empty spatial index means the roster is empty, so this is a dict truth
+        test — ideal as an early-out before per-tick queries during quiet frames
+        (e.g. between enemy waves).
+
+        :param entity_type: The type of Entity to look for.
+        :return: True if at least one entity of the given type is alive, False otherwise.
+        """
+        return bool(self._index_of(entity_type))
+
+    def has_nearby(self, loc: Location, entity_type: Type[Entity]) -> bool:
+        """
+        Cheaply checks whether any Entity of type `entity_type` could be close to the given location.
+
+        Looks at the spatial index bucket containing `loc` and its eight neighbours,
+        covering roughly 48px in every direction. Intended as a broad-phase guard
+        before a full `nearby_entities_type` scan; may return True for entities that
+        are just out of range, but never False when one is within a bucket's reach.
+
+        :param loc: The location to check around.
+        :param entity_type: The type of Entity to look for.
+        :return: True if an entity of the given type may be nearby, False otherwise.
+        """
+        buckets = self._index_of(entity_type)
+        if not buckets:
+            return False
+        cx = int(loc.x) >> INDEX_CELL_SHIFT
+        cy = int(loc.y) >> INDEX_CELL_SHIFT
+        for x in (cx - 1, cx, cx + 1):
+            for y in (cy - 1, cy, cy + 1):
+                if (x, y) in buckets:
+                    return True
+        return False
+
+    def query_nearby(self, loc: Location, radius: float, entity_type: Type[T]) -> list[T]:
+        """
+        Gets the entities of type `entity_type` within `radius` of the given location,
+        using the spatial index instead of scanning every registered entity.
+
+        Bucket membership can be up to one frame stale, so the bucket range is padded
+        by one cell; the distance check itself always uses live positions.
+
+        :param loc: The location to search around.
+        :param radius: The maximum distance the entities can be, before being excluded.
+        :param entity_type: The type of the entities to look for.
+        :return: A list of entities of the given type within the given radius.
+        """
+        buckets = self._index_of(entity_type)
+        if not buckets:
+            return []
+        radius_sqr = radius * radius
+        min_x = (int(loc.x - radius) >> INDEX_CELL_SHIFT) - 1
+        max_x = (int(loc.x + radius) >> INDEX_CELL_SHIFT) + 1
+        min_y = (int(loc.y - radius) >> INDEX_CELL_SHIFT) - 1
+        max_y = (int(loc.y + radius) >> INDEX_CELL_SHIFT) + 1
+        found = []
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(buckets):
+            # the radius covers more cells than exist; walking every bucket is cheaper
+            for bucket in buckets.values():
+                for entity in bucket:
+                    if not entity._removed and entity._loc.dist_sqr(loc) <= radius_sqr:
+                        found.append(entity)
+            return found
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                bucket = buckets.get((x, y))
+                if bucket:
+                    for entity in bucket:
+                        if not entity._removed and entity._loc.dist_sqr(loc) <= radius_sqr:
+                            found.append(entity)
+        return found
+
+    def apply_nearby(self, loc: Location, radius: float, entity_type: Type[T],
+                     fn: Callable[[T], None]) -> None:
+        """
+        Calls `fn` on every entity of type `entity_type` within `radius` of the
+        given location, without building an intermediate list.
+
+        Useful for area-of-effect application where the matches are consumed
+        immediately; `fn` must not register or dispose entities mid-traversal.
+
+        :param loc: The location to search around.
+        :param radius: The maximum distance the entities can be, before being excluded.
+        :param entity_type: The type of the entities to look for.
+        :param fn: The callable applied to each match.
+        :return: None.
+        """
+        buckets = self._index_of(entity_type)
+        if not buckets:
+            return
+        radius_sqr = radius * radius
+        min_x = (int(loc.x - radius) >> INDEX_CELL_SHIFT) - 1
+        max_x = (int(loc.x + radius) >> INDEX_CELL_SHIFT) + 1
+        min_y = (int(loc.y - radius) >> INDEX_CELL_SHIFT) - 1
+        max_y = (int(loc.y + radius) >> INDEX_CELL_SHIFT) + 1
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(buckets):
+            for bucket in buckets.values():
+                for entity in bucket:
+                    if not entity._removed and entity._loc.dist_sqr(loc) <= radius_sqr:
+                        fn(entity)
+            return
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                bucket = buckets.get((x, y))
+                if bucket:
+                    for entity in bucket:
+                        if not entity._removed and entity._loc.dist_sqr(loc) <= radius_sqr:
+                            fn(entity)
+
+    def first_nearby(self, loc: Location, radius: float, entity_type: Type[T]) -> 'T | None':
+        """
+        Gets the first entity of type `entity_type` within `radius` of the given
+        location, short-circuiting on the first hit instead of building a list.
+
+        The projectile collision path only ever consumes one hit, so this avoids
+        both the list allocation and the remaining distance checks.
+
+        :param loc: The location to search around.
+        :param radius: The maximum distance the entity can be, before being excluded.
+        :param entity_type: The type of the entity to look for.
+        :return: The first entity of the given type within the given radius, or None.
+        """
+        buckets = self._index_of(entity_type)
+        if not buckets:
+            return None
+        radius_sqr = radius * radius
+        min_x = (int(loc.x - radius) >> INDEX_CELL_SHIFT) - 1
+        max_x = (int(loc.x + radius) >> INDEX_CELL_SHIFT) + 1
+        min_y = (int(loc.y - radius) >> INDEX_CELL_SHIFT) - 1
+        max_y = (int(loc.y + radius) >> INDEX_CELL_SHIFT) + 1
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(buckets):
+            for bucket in buckets.values():
+                for entity in bucket:
+                    if not entity._removed and entity._loc.dist_sqr(loc) <= radius_sqr:
+                        return entity
+            return None
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                bucket = buckets.get((x, y))
+                if bucket:
+                    for entity in bucket:
+                        if not entity._removed and entity._loc.dist_sqr(loc) <= radius_sqr:
+                            return entity
+        return None
+
+    def _index_of(self, entity_type: Type[Entity]) -> dict[tuple[int, int], list[Entity]]:
+        """
+        Gets the spatial index for the given Entity type, building it on first use.
+
+        Indexes are rebuilt once per tick; between rebuilds they may be up to one
+        frame stale, which is fine for broad-phase queries.
+
+        :param entity_type: The type of Entity the index is keyed on.
+        :return: A dict of bucket coordinates to the entities inside each bucket.
+        """
+        buckets = self._type_indexes.get(entity_type)
+        if buckets is None:
+            buckets = self._type_indexes[entity_type] = {}
+            self._fill_index(entity_type, buckets)
+        return buckets
+
+    def _rebuild_type_indexes(self) -> None:
+        """
+        Rebuilds every registered spatial index from the current entity list.
+
+        Called once at the end of each tick.
+
+        :return: None.
+        """
+        for entity_type, buckets in self._type_indexes.items():
+            buckets.clear()
+            self._fill_index(entity_type, buckets)
+
+    def _fill_index(self, entity_type: Type[Entity], buckets: dict[tuple[int, int], list[Entity]]) -> None:
+        for entity in self._entities:
+            if isinstance(entity, entity_type) and not entity.removed:
+                loc = entity._loc
+                key = (int(loc.x) >> INDEX_CELL_SHIFT, int(loc.y) >> INDEX_CELL_SHIFT)
+                if key in buckets:
+                    buckets[key].append(entity)
+                else:
+                    buckets[key] = [entity]
+
     def dispose_offscreen_entities(self, dispose: bool, *, pixels_offscreen: int = 0) -> None:
         """
         Tells the Entity Handler to dispose entities that are off the screen by the given
@@ -607,7 +867,7 @@ class String(Entity):
         pass
 
     def draw(self, surface: Surface) -> None:
-        surface.blit(self._surface, self._loc.as_tuple())
+        surface.blit(self._surface, (self._loc.x, self._loc.y))
 
     def bounds(self) -> Rect:
         return self._surface.get_rect()
@@ -678,7 +938,7 @@ class StrokedString(Entity):
         pass
 
     def draw(self, surface: Surface) -> None:
-        surface.blit(self._surface, self.location.as_tuple())
+        surface.blit(self._surface, (self._loc.x, self._loc.y))
 
     def bounds(self) -> Rect:
         return self._surface.get_rect()
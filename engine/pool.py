@@ -0,0 +1,45 @@
+from typing import Callable, Generic, TypeVar
+
+from engine.entity import Entity
+
+E = TypeVar('E', bound=Entity)
+
+
+class EntityPool(Generic[E]):
+    """
+    A freelist of reusable entities.
+
+    Projectile-style entities are created and disposed constantly; pooling them
+    avoids re-allocating each one from scratch and the GC churn that comes with it.
+    Entities enter the pool from `Entity._on_remove`, i.e. only once the
+    EntityHandler has actually dropped them from its list — never while they are
+    still registered.
+    """
+
+    def __init__(self, factory: Callable[[], E], *, max_size: int = 256):
+        self._factory = factory
+        self._free: list[E] = []
+        self._max_size = max_size
+
+    def acquire(self) -> E:
+        """
+        Gets a reusable entity, constructing a fresh one if the pool is empty.
+
+        The caller is responsible for re-initializing the entity's state
+        (via `Entity._reset` plus any subclass fields) before registering it.
+
+        :return: A pooled or newly constructed entity.
+        """
+        if self._free:
+            return self._free.pop()
+        return self._factory()
+
+    def release(self, entity: E) -> None:
+        """
+        Returns an entity to the pool, dropping it if the pool is already full.
+
+        :param entity: The entity to recycle.
+        :return: None.
+        """
+        if len(self._free) < self._max_size:
+            self._free.append(entity)
@@ -1,4 +1,3 @@
-from abc import abstractmethod
 from enum import Enum
 from typing import TypeVar, Callable
 
@@ -10,9 +9,16 @@ from engine.entity import LivingEntity
 
 SPRITE_STATE = TypeVar('SPRITE_STATE', bound=Enum)
 
+# Scaled animation frames keyed by (path, state value, frame count, scalar).
+# Frames are only ever blitted, so instances of the same sprite can share them;
+# without this every tower placement re-decodes and re-scales its PNGs.
+_frame_cache: dict[tuple[str, str, int, float], list[Surface]] = {}
+
 
 class StateChange:
 
+    __slots__ = ('_before', '_callback', '_loops')
+
     def __init__(self, before: SPRITE_STATE, callback: Callable[[], None], loops: int):
         self._before = before
         self._callback = callback
@@ -27,6 +33,9 @@ class StateChange:
 
 class Sprite(LivingEntity):
 
+    __slots__ = ('_state', '_animations', '_states', '_state_change', '_scalar',
+                 '_frame_index', '_tick_index', '_ticks_per_frame')
+
     def __init__(self,
                  default_state: SPRITE_STATE,
                  *,
@@ -59,7 +68,8 @@ class Sprite(LivingEntity):
 
     def draw(self, surface: Surface) -> None:
         super().draw(surface)
-        surface.blit(self._animations[self._state][self._frame_index], self.location.as_tuple())
+        loc = self._loc
+        surface.blit(self._animations[self._state][self._frame_index], (loc.x, loc.y))
 
     def bounds(self) -> Rect:
         state_image = self._animations[self._state][self._frame_index]
@@ -81,13 +91,19 @@ class Sprite(LivingEntity):
         """
         if state in self._states:
             raise EngineError(f'The sprite state {state.name} has already been set.')
-        images = []
-        for i in range(frame_count):
-            image = pygame.image.load(f'{path}/{state.value}/{i}.png')
-            new_width = image.get_width() * self._scalar
-            new_height = image.get_height() * self._scalar
-            image = pygame.transform.scale(image, (new_width, new_height))
-            images.append(image)
+        key = (path, state.value, frame_count, self._scalar)
+        images = _frame_cache.get(key)
+        if images is None:
+            images = []
+            for i in range(frame_count):
+                # convert to the display's pixel format once at load so every
+                # frame blit takes SDL's fast same-format path
+                image = pygame.image.load(f'{path}/{state.value}/{i}.png').convert_alpha()
+                new_width = image.get_width() * self._scalar
+                new_height = image.get_height() * self._scalar
+                image = pygame.transform.scale(image, (new_width, new_height))
+                images.append(image)
+            _frame_cache[key] = images
         self._animations[state] = images
         self._states[state] = (path, frame_count)
 
@@ -120,19 +136,4 @@ class Sprite(LivingEntity):
         if self._state_change:
             self._state_change = None
 
-    @property
-    @abstractmethod
-    def max_health(self) -> int:
-        pass
-
-    @abstractmethod
-    def _on_damage(self) -> None:
-        pass
-
-    @abstractmethod
-    def _on_heal(self) -> None:
-        pass
 
-    @abstractmethod
-    def _on_death(self) -> None:
-        pass
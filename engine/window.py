@@ -66,6 +66,15 @@ class Window:
         self._clock = Clock()
         self._tick_count = 0
 
+    @property
+    def tick_count(self) -> int:
+        """
+        The number of ticks elapsed since the game loop started.
+
+        :return: The current tick count.
+        """
+        return self._tick_count
+
     def start(self) -> None:
         """
         Starts the game loop and opens the window.
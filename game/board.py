@@ -1,6 +1,7 @@
 from abc import abstractmethod
-from enum import Enum
-from random import choice
+from enum import Enum, IntEnum
+from math import hypot
+from random import Random
 from threading import Timer
 from typing import Callable, Union
 
@@ -20,29 +21,42 @@ from game.texture import Texture
 
 ON_ENEMY_DEATH = new_event()
 
+# Shared RNG instance; bound-method calls skip the module-level indirection.
+_rand = Random()
+
+# Unpacked once; bounds() runs every draw/collision query and shouldn't re-unpack the tuple.
+_CELL_W, _CELL_H = CELL_SIZE
+
 
 class Cell(Entity):
 
+    # every cell blits the identical surface, so load and scale it once for the
+    # whole board instead of once per cell (lazy: pygame may not be up at import)
+    _shared_texture: Surface | None = None
+
     def __init__(self, x: int, y: int, grid: 'Grid', *, tower: 'Tower | None' = None):
         super().__init__()
         self._x = x
         self._y = y
         self._grid = grid
         self._tower = tower
-        texture = pygame.image.load(Texture.CELL.value)
-        self._texture = pygame.transform.scale(texture, CELL_SIZE)
+        if Cell._shared_texture is None:
+            texture = pygame.image.load(Texture.CELL.value)
+            Cell._shared_texture = pygame.transform.scale(texture, CELL_SIZE)
+        self._texture = Cell._shared_texture
+        self._blit_pos = (0, 0)
 
     def tick(self, tick_count: int) -> None:
         if self._tower:
             self._tower.tick(tick_count)
 
     def draw(self, surface: Surface) -> None:
-        surface.blit(self._texture, self.location.as_tuple())
+        surface.blit(self._texture, self._blit_pos)
         if self._tower:
             self._tower.draw(surface)
 
     def bounds(self) -> Rect:
-        return self.location.as_rect(CELL_SIZE[0], CELL_SIZE[1])
+        return self.location.as_rect(_CELL_W, _CELL_H)
 
     @property
     def empty(self) -> bool:
@@ -99,6 +113,9 @@ class Cell(Entity):
     @Entity.location.setter
     def location(self, value: Union[Location, Callable[[Rect], Location]]) -> None:
         self._loc = value if isinstance(value, Location) else value(self.bounds())
+        # cells only move when the grid is laid out, so cache the blit position here
+        # instead of allocating a tuple per cell per frame in draw()
+        self._blit_pos = self._loc.as_tuple()
         if self._tower:
             self._tower.location = value
 
@@ -187,26 +204,25 @@ class Grid(Entity):
 TEXTURE_PATH = 'game/asset/tower'
 
 
-class EntityTargetType(Enum):
-    ENEMY = 0,
-    PLAYER = 1,
-    TOWER = 2,
+class EntityTargetType(IntEnum):
+    ENEMY = 0
+    PLAYER = 1
+    TOWER = 2
     NONE = 3
 
 
-class TowerStage(Enum):
-    STAGE_1 = 1,
-    STAGE_2 = 2,
+class TowerStage(IntEnum):
+    STAGE_1 = 1
+    STAGE_2 = 2
     STAGE_3 = 3
 
     def next(self) -> 'TowerStage | None':
-        match self:
-            case TowerStage.STAGE_1:
-                return TowerStage.STAGE_2
-            case TowerStage.STAGE_2:
-                return TowerStage.STAGE_3
-            case _:
-                return None
+        return _NEXT_STAGE[self]
+
+
+_NEXT_STAGE = {TowerStage.STAGE_1: TowerStage.STAGE_2,
+               TowerStage.STAGE_2: TowerStage.STAGE_3,
+               TowerStage.STAGE_3: None}
 
 
 class TowerState(Enum):
@@ -219,6 +235,9 @@ class Tower(Sprite):
 
     # this is an abstract class, so you'll need to create subclasses that extend Tower
 
+    __slots__ = ('_cell', 'on_cooldown', '_regeneration_rate', '_starting_health', '_building_cost',
+                 '_ability_cooldown', '_area_of_effect', '_ability_timer', '_stage')
+
     def __init__(self,
                  *,
                  scalar: float = 1,
@@ -252,24 +271,34 @@ class Tower(Sprite):
             self.perform_ability()
 
     def bounds(self) -> Rect:
-        w, h = CELL_SIZE
-        return self.location.as_rect(w, h)
+        return self.location.as_rect(_CELL_W, _CELL_H)
+
+    # Per-stage stat overrides, keyed by the stage being entered. Subclasses
+    # either provide their own table or override _on_upgrade outright.
+    _STAGE_STATS: dict[TowerStage, dict[str, int | float]] = {}
 
     @abstractmethod
     def _on_ability(self, *args: Entity) -> None:
         pass
 
-    @abstractmethod
     def _on_upgrade(self, stage: TowerStage) -> None:
-        pass
+        stats = self._STAGE_STATS.get(stage)
+        if stats:
+            for name, value in stats.items():
+                setattr(self, name, value)
 
-    @abstractmethod
-    def entity_target(self) -> EntityTargetType:
+    # the type of Entity that the tower will target; constant per class, so a
+    # class attribute instead of a method the ability path re-enters every cast
+    entity_target: EntityTargetType = EntityTargetType.NONE
+
+    def single_target(self) -> bool:
         """
-        The type of Entity that the towers will target.
+        Whether the tower's ability only ever consumes a single target.
+        When True, `perform_ability` short-circuits on the first enemy in range
+        instead of collecting every enemy in the area of effect.
         :return:
         """
-        pass
+        return False
 
     @property
     def stage(self) -> TowerStage:
@@ -344,15 +373,29 @@ class Tower(Sprite):
         return self._area_of_effect
 
     def perform_ability(self) -> None:
+        target_type = self.entity_target
+        if target_type is EntityTargetType.NONE:
+            # no target list to build; fire unconditionally
+            self.queue_state(TowerState.PERFORMING_ABILITY, self._post_ability)
+            self._on_ability()
+            self.on_cooldown = True
+            return
         targets: list[Entity] = []
-        match self.entity_target():
+        match target_type:
             case EntityTargetType.ENEMY:
-                targets = self.nearby_entities_type(self.area_of_effect(), Enemy)
+                if not engine.entity_handler.has_any(Enemy):
+                    self.on_cooldown = False
+                    return
+                if self.single_target():
+                    target = self.first_nearby_entity_type(self._area_of_effect, Enemy)
+                    targets = [target] if target else []
+                else:
+                    targets = self.nearby_entities_type(self._area_of_effect, Enemy)
             case EntityTargetType.TOWER:
-                targets = self.nearby_entities_type(self.area_of_effect(), Tower)
+                targets = self.nearby_entities_type(self._area_of_effect, Tower)
             case EntityTargetType.PLAYER:
                 targets = engine.entity_handler.get_entities(Player)
-        if len(targets) > 0 or self.entity_target() is EntityTargetType.NONE:
+        if targets:
             self.queue_state(TowerState.PERFORMING_ABILITY, self._post_ability)
             self._on_ability(*targets)
             self.on_cooldown = True
@@ -375,15 +418,13 @@ def calculate_projectile_vel(self: Entity, target: Entity, max_velocity: int) ->
     target_location = target.location
     x_distance = orgin.directional_dist_x(target_location)
     y_distance = orgin.directional_dist_y(target_location)
-    total_distance = abs(y_distance) + abs(x_distance)
-    distance_ratio = abs(x_distance / total_distance)
-    x_velocity = distance_ratio * max_velocity
-    y_velocity = (1 - distance_ratio) * max_velocity
-    if x_distance < 0:
-        x_velocity *= -1
-    if y_distance < 0:
-        y_velocity *= -1
-    return x_velocity, y_velocity
+    # normalize against the true distance; the old Manhattan ratio made shots
+    # diagonal-slow and needed per-axis sign fix-ups on top
+    distance = hypot(x_distance, y_distance)
+    if not distance:
+        return 0, 0
+    scale = max_velocity / distance
+    return x_distance * scale, y_distance * scale
 
 
 class EnemyState(Enum):
@@ -442,7 +483,7 @@ class Enemy(Sprite):
                 target_range += 1
                 if target_range == 6:
                     return
-            self.target = choice(targets)
+            self.target = _rand.choice(targets)
             self.aquired_target = True
         self._target_timer += 1
 
@@ -452,8 +493,7 @@ class Enemy(Sprite):
         # detect if the entity is on target
         if not self.on_target:
             self._velocity = self.calculate_travel_velocity()
-            collisions = self.nearby_entities_type(10, Tower)
-            if self.target in collisions:
+            if self.location.dist_sqr(self.target.location) <= 100:
                 self._velocity = (0, 0)
                 self.on_target = True
 
@@ -476,18 +516,7 @@ class Enemy(Sprite):
         else:
             self.on_cooldown = False
 
-    @property
-    def max_health(self) -> int:
-        return 200
-
-    def _on_dispose(self) -> None:
-        print(f"I am dying {self.location}")
-
-    def _on_damage(self) -> None:
-        pass
-
-    def _on_heal(self) -> None:
-        pass
+    max_health = 200
 
     def _on_death(self) -> None:
         pygame.event.post(Event(ON_ENEMY_DEATH))
@@ -498,6 +527,8 @@ CORE_TEXTURE_PATH = f'{TEXTURE_PATH}/core'
 
 class CoreTower(Tower):
 
+    __slots__ = ('_max_velocity', '_damage', '_upgrade_cost')
+
     def __init__(self):
         super().__init__(scalar=0.6, ticks_per_frame=4)
         self.add_state(TowerState.IDLE, CORE_TEXTURE_PATH, 1)
@@ -512,58 +543,43 @@ class CoreTower(Tower):
         self._area_of_effect = 150
 
     def _on_ability(self, *args: Enemy) -> None:
-        projectile_velocity = calculate_projectile_vel(self, choice(args), self._max_velocity)
-        projectile = CoreProjectile(location=self.location.copy(), velocity=projectile_velocity, damage=self._damage,
+        loc = self.location
+        target = min(args, key=lambda e: loc.dist_sqr(e.location))
+        projectile_velocity = calculate_projectile_vel(self, target, self._max_velocity)
+        projectile = CoreProjectile(self.location.x, self.location.y, velocity=projectile_velocity, damage=self._damage,
                                     priority=20)
         engine.entity_handler.register_entity(projectile)
         projectile.spawn()
 
-    def entity_target(self) -> EntityTargetType:
-        return EntityTargetType.ENEMY
-
-    def _on_upgrade(self, stage: TowerStage) -> None:
-        match stage:
-            case TowerStage.STAGE_2:
-                self._damage = 50
-                self._max_health = 1500
-                self._health = 1500
-                self._area_of_effect = 150
-                self._regeneration_rate = 2
-                self._upgrade_cost = 250
-            case TowerStage.STAGE_3:
-                self._damage = 80
-                self._max_health = 2500
-                self._health = 2500
-                self._area_of_effect = 250
-                self._regeneration_rate = 3
+    entity_target = EntityTargetType.ENEMY
 
-    @property
-    def max_health(self) -> int:
-        return 1000
+    _STAGE_STATS = {
+        TowerStage.STAGE_2: {'_damage': 50, '_max_health': 1500, '_health': 1500, '_area_of_effect': 150,
+                             '_regeneration_rate': 2, '_upgrade_cost': 250},
+        TowerStage.STAGE_3: {'_damage': 80, '_max_health': 2500, '_health': 2500, '_area_of_effect': 250,
+                             '_regeneration_rate': 3},
+    }
 
-    def _on_damage(self) -> None:
-        pass
+    max_health = 1000
 
-    def _on_heal(self) -> None:
-        pass
-
-    def _on_death(self) -> None:
-        pass
 
 
 class CoreProjectile(Entity):
 
-    def __init__(self, location: Location = Location(),
+    __slots__ = ('_velocity', '_max_velocity', '_damage', '_radius', 'color', '_rect')
+
+    def __init__(self, x: float = 0, y: float = 0,
                  priority: int = 0,
                  *,
                  velocity: tuple[float, float] = (0, 0),
                  damage: int = 0):
-        super().__init__(location, priority)
+        super().__init__(Location(x, y), priority)
         self._velocity = velocity
         self._max_velocity = 5
         self._damage = damage
         self._radius = 10
         self.color = (100, 100, 100)
+        self._rect = Rect(int(x), int(y), self._radius, self._radius)
 
     @property
     def velocity(self) -> tuple[float, float]:
@@ -574,16 +590,22 @@ class CoreProjectile(Entity):
         self._velocity = value
 
     def tick(self, tick_count: int) -> None:
-        self.location.add(self._velocity[0], self._velocity[1])
-        collisions = self.nearby_entities_type(self._radius, Enemy)
-        if len(collisions) > 0:
-            self.on_collide(collisions[0])
+        vx, vy = self._velocity
+        loc = self._loc
+        loc.x += vx
+        loc.y += vy
+        rect = self._rect
+        rect.x = int(loc.x)
+        rect.y = int(loc.y)
+        hit = engine.entity_handler.first_nearby(loc, self._radius, Enemy)
+        if hit is not None:
+            self.on_collide(hit)
 
     def draw(self, surface: Surface) -> None:
-        surface.fill(self.color, self.bounds())
+        surface.fill(self.color, self._rect)
 
     def bounds(self) -> Rect:
-        return self.location.as_rect(self._radius, self._radius)
+        return self._rect
 
     def on_collide(self, entity: LivingEntity):
         entity.damage(self._damage)
@@ -159,9 +159,7 @@ class Player(Sprite):
     def accept_input(self, value: bool) -> None:
         self._accept_input = value
 
-    @property
-    def max_health(self) -> int:
-        return 500
+    max_health = 500
 
     def _on_damage(self) -> None:
         # do nothing
@@ -1,10 +1,9 @@
-import random
-
 from pygame import Surface, Rect
 
 import engine
 from engine.entity import Entity, LivingEntity
 from engine.location import Location
+from engine.pool import EntityPool
 from game.board import Tower, calculate_projectile_vel, Enemy, EntityTargetType, TowerStage, TowerState, TEXTURE_PATH
 
 ARCHER_ASSETS = f'{TEXTURE_PATH}/archer'
@@ -12,6 +11,8 @@ ARCHER_ASSETS = f'{TEXTURE_PATH}/archer'
 
 class Archer(Tower):
 
+    __slots__ = ('_max_velocity', '_dmg_amt', '_upgrade_cost')
+
     def __init__(self):
         super().__init__(scalar=3, ticks_per_frame=4)
         self.add_state(TowerState.IDLE, ARCHER_ASSETS, 1)
@@ -26,60 +27,43 @@ class Archer(Tower):
         self._area_of_effect = 150
 
     def _on_ability(self, *args: Enemy) -> None:
-        projectile_velocity = calculate_projectile_vel(self, random.choice(args), self._max_velocity)
-        projectile = ArcherProjectile(location=self.location.copy(), velocity=projectile_velocity, damage=self._dmg_amt,
+        loc = self.location
+        target = min(args, key=lambda e: loc.dist_sqr(e.location))
+        projectile_velocity = calculate_projectile_vel(self, target, self._max_velocity)
+        projectile = ArcherProjectile.acquire(self.location.x, self.location.y, velocity=projectile_velocity, damage=self._dmg_amt,
                                       priority=20)
         engine.entity_handler.register_entity(projectile)
         projectile.spawn()
 
-    def entity_target(self) -> EntityTargetType:
-        return EntityTargetType.ENEMY
-
-    def _on_upgrade(self, stage: TowerStage) -> None:
-        match stage:
-            case TowerStage.STAGE_2:
-                self._dmg_amt = 30
-                self._max_health = 300
-                self._health = 300
-                self._area_of_effect = 200
-                self._regeneration_rate = 1
-                self._upgrade_cost = 70
-                self._ability_cooldown = 0.8
-            case TowerStage.STAGE_3:
-                self._dmg_amt = 45
-                self._max_health = 450
-                self._health = 450
-                self._area_of_effect = 250
-                self._regeneration_rate = 1
-                self._ability_cooldown = 0.5
+    entity_target = EntityTargetType.ENEMY
 
-    @property
-    def max_health(self) -> int:
-        return 200
+    _STAGE_STATS = {
+        TowerStage.STAGE_2: {'_dmg_amt': 30, '_max_health': 300, '_health': 300, '_area_of_effect': 200,
+                             '_regeneration_rate': 1, '_upgrade_cost': 70, '_ability_cooldown': 0.8},
+        TowerStage.STAGE_3: {'_dmg_amt': 45, '_max_health': 450, '_health': 450, '_area_of_effect': 250,
+                             '_regeneration_rate': 1, '_ability_cooldown': 0.5},
+    }
 
-    def _on_damage(self) -> None:
-        pass
+    max_health = 200
 
-    def _on_heal(self) -> None:
-        pass
-
-    def _on_death(self) -> None:
-        pass
 
 
 class ArcherProjectile(Entity):
 
-    def __init__(self, location: Location = Location(),
+    __slots__ = ('_velocity', '_max_velocity', '_damage', '_radius', 'color', '_rect')
+
+    def __init__(self, x: float = 0, y: float = 0,
                  priority: int = 0,
                  *,
                  velocity: tuple[float, float] = (0, 0),
                  damage: int = 0):
-        super().__init__(location, priority)
+        super().__init__(Location(x, y), priority)
         self._velocity = velocity
         self._max_velocity = 5
         self._damage = damage
         self._radius = 10
         self.color = (100, 100, 100)
+        self._rect = Rect(int(x), int(y), self._radius, self._radius)
 
     @property
     def velocity(self) -> tuple[float, float]:
@@ -90,17 +74,50 @@ class ArcherProjectile(Entity):
         self._velocity = value
 
     def tick(self, tick_count: int) -> None:
-        self.location.add(self._velocity[0], self._velocity[1])
-        collisions = self.nearby_entities_type(self._radius, Enemy)
-        if len(collisions) > 0:
-            self.on_collide(collisions[0])
+        # mutate the raw coordinates; Location.add/as_rect dispatch adds up
+        # across hundreds of projectiles per frame
+        loc = self._loc
+        loc.x += self._velocity[0]
+        loc.y += self._velocity[1]
+        rect = self._rect
+        rect.x = int(loc.x)
+        rect.y = int(loc.y)
+        # broad-phase guard: most in-flight ticks are nowhere near an enemy
+        if not engine.entity_handler.has_nearby(loc, Enemy):
+            return
+        hit = engine.entity_handler.first_nearby(self._loc, self._radius, Enemy)
+        if hit is not None:
+            self.on_collide(hit)
 
     def draw(self, surface: Surface) -> None:
-        surface.fill(self.color, self.bounds())
+        surface.fill(self.color, self._rect)
 
     def bounds(self) -> Rect:
-        return self.location.as_rect(self._radius, self._radius)
+        return self._rect
 
     def on_collide(self, entity: LivingEntity):
         entity.damage(self._damage)
         self.dispose()
+
+    @classmethod
+    def acquire(cls, x: float, y: float, priority: int = 0, *,
+                velocity: tuple[float, float] = (0, 0),
+                damage: int = 0) -> 'ArcherProjectile':
+        """
+        Gets a projectile from the pool (or a new one), re-initialized with the given state.
+
+        :return: A ready-to-register ArcherProjectile.
+        """
+        projectile = _projectile_pool.acquire()
+        projectile._reset(Location(x, y), priority)
+        projectile._velocity = velocity
+        projectile._damage = damage
+        projectile._rect.x = int(x)
+        projectile._rect.y = int(y)
+        return projectile
+
+    def _on_remove(self) -> None:
+        _projectile_pool.release(self)
+
+
+_projectile_pool: EntityPool[ArcherProjectile] = EntityPool(ArcherProjectile)
@@ -1,17 +1,43 @@
 import random
+from math import ceil, cos, sin, tau
 
 from pygame import Surface, Rect
 
 import engine
 from engine.entity import Entity, LivingEntity
 from engine.location import Location
+from engine.pool import EntityPool
 from game.board import Tower, Enemy, calculate_projectile_vel, EntityTargetType, TowerStage, TowerState, TEXTURE_PATH
 
 SHRAPNEL_ASSETS = f'{TEXTURE_PATH}/shrap'
 
+# Shared RNG instance; bound-method calls skip the module-level indirection.
+_rand = random.Random()
+
+
+def _shard_velocities(count: int) -> list[tuple[float, float]]:
+    """
+    Generates `count` outward shard velocities with speeds in [5, 8).
+
+    Direct polar sampling: the old rejection loop redrew until the components
+    summed past the minimum speed, costing an unbounded number of RNG calls.
+
+    :param count: The number of shards to generate velocities for.
+    :return: A list of (x, y) velocity tuples.
+    """
+    rand = _rand.random
+    velocities = []
+    for _ in range(count):
+        theta = rand() * tau
+        speed = 5.0 + rand() * 3.0
+        velocities.append((speed * cos(theta), speed * sin(theta)))
+    return velocities
+
 
 class ShrapnelCannon(Tower):
 
+    __slots__ = ('_max_velocity', '_dmg_amt', '_upgrade_cost', '_secondary_count')
+
     def __init__(self):
         super().__init__(scalar=3, ticks_per_frame=4)
         self.add_state(TowerState.IDLE, SHRAPNEL_ASSETS, 1)
@@ -27,60 +53,43 @@ class ShrapnelCannon(Tower):
         self._secondary_count = 6
 
     def _on_ability(self, *args: Enemy) -> None:
-        projectile_velocity = calculate_projectile_vel(self, random.choice(args), self._max_velocity)
-        projectile = ShrapnelProjectile(location=self.location.copy(), velocity=projectile_velocity,
+        loc = self.location
+        target = min(args, key=lambda e: loc.dist_sqr(e.location))
+        projectile_velocity = calculate_projectile_vel(self, target, self._max_velocity)
+        projectile = ShrapnelProjectile.acquire(self.location.x, self.location.y, velocity=projectile_velocity,
                                         damage=self._dmg_amt, priority=20, secondary_count=self._secondary_count)
         engine.entity_handler.register_entity(projectile)
         projectile.spawn()
 
-    def entity_target(self) -> EntityTargetType:
-        return EntityTargetType.ENEMY
-
-    def _on_upgrade(self, stage: TowerStage) -> None:
-        match stage:
-            case TowerStage.STAGE_2:
-                self._dmg_amt = 30
-                self._max_health = 450
-                self._health = 450
-                self._area_of_effect = 300
-                self._regeneration_rate = 0
-                self._upgrade_cost = 250
-                self._secondary_count = 12
-            case TowerStage.STAGE_3:
-                self._dmg_amt = 30
-                self._max_health = 650
-                self._health = 650
-                self._area_of_effect = 400
-                self._regeneration_rate = 1
-                self._secondary_count = 20
-
-    @property
-    def max_health(self) -> int:
-        return 350
+    entity_target = EntityTargetType.ENEMY
 
-    def _on_damage(self) -> None:
-        pass
+    _STAGE_STATS = {
+        TowerStage.STAGE_2: {'_dmg_amt': 30, '_max_health': 450, '_health': 450, '_area_of_effect': 300,
+                             '_regeneration_rate': 0, '_upgrade_cost': 250, '_secondary_count': 12},
+        TowerStage.STAGE_3: {'_dmg_amt': 30, '_max_health': 650, '_health': 650, '_area_of_effect': 400,
+                             '_regeneration_rate': 1, '_secondary_count': 20},
+    }
 
-    def _on_heal(self) -> None:
-        pass
+    max_health = 350
 
-    def _on_death(self) -> None:
-        pass
 
 
 class ShrapnelProjectileSecondary(Entity):
 
-    def __init__(self, location: Location = Location(),
+    __slots__ = ('_velocity', '_max_velocity', '_damage', '_radius', 'color', '_rect')
+
+    def __init__(self, x: float = 0, y: float = 0,
                  priority: int = 0,
                  *,
                  velocity: tuple[float, float] = (0, 0),
                  damage: int = 0):
-        super().__init__(location, priority)
+        super().__init__(Location(x, y), priority)
         self._velocity = velocity
         self._max_velocity = 5
         self._damage = damage
         self._radius = 4
         self.color = (0, 0, 0)
+        self._rect = Rect(int(x), int(y), self._radius, self._radius)
 
     @property
     def velocity(self) -> tuple[float, float]:
@@ -91,38 +100,87 @@ class ShrapnelProjectileSecondary(Entity):
         self._velocity = value
 
     def tick(self, tick_count: int) -> None:
-        self.location.add(self._velocity[0], self._velocity[1])
-        collisions = self.nearby_entities_type(self._radius, Enemy)
-        if len(collisions) > 0:
-            self.on_collide(collisions[0])
+        vx, vy = self._velocity
+        loc = self._loc
+        loc.x += vx
+        loc.y += vy
+        rect = self._rect
+        rect.x = int(loc.x)
+        rect.y = int(loc.y)
+        hit = engine.entity_handler.first_nearby(loc, self._radius, Enemy)
+        if hit is not None:
+            self.on_collide(hit)
 
     def draw(self, surface: Surface) -> None:
-        surface.fill(self.color, self.bounds())
+        surface.fill(self.color, self._rect)
 
     def bounds(self) -> Rect:
-        return self.location.as_rect(self._radius, self._radius)
+        return self._rect
 
     def on_collide(self, entity: LivingEntity):
         entity.damage(self._damage)
         self.dispose()
 
+    @classmethod
+    def acquire(cls, x: float, y: float, priority: int = 0, *,
+                velocity: tuple[float, float] = (0, 0),
+                damage: int = 0) -> 'ShrapnelProjectileSecondary':
+        """
+        Gets a shard from the pool (or a new one), re-initialized with the given state.
+
+        :return: A ready-to-register ShrapnelProjectileSecondary.
+        """
+        projectile = _secondary_pool.acquire()
+        projectile._reset(Location(x, y), priority)
+        projectile._velocity = velocity
+        projectile._damage = damage
+        projectile._rect.x = int(x)
+        projectile._rect.y = int(y)
+        return projectile
+
+    def _on_remove(self) -> None:
+        _secondary_pool.release(self)
+
+
+_secondary_pool: EntityPool[ShrapnelProjectileSecondary] = EntityPool(ShrapnelProjectileSecondary)
+
+
+def _expiry_tick(velocity: tuple[float, float]) -> int:
+    """
+    Computes the tick at which a shrapnel shell travelling at `velocity` expires.
+
+    Pinning the expiry tick at spawn replaces a per-tick subtract-and-compare
+    countdown, and using component magnitudes fixes the old signed-sum distance
+    (a positive+negative velocity could cancel out and never expire).
+
+    :param velocity: The shell's (x, y) velocity.
+    :return: The absolute tick count at which the shell should detonate.
+    """
+    speed = abs(velocity[0]) + abs(velocity[1])
+    if not speed:
+        return 1 << 30
+    return engine.window.tick_count + ceil(250 / speed)
+
 
 class ShrapnelProjectile(Entity):
 
-    def __init__(self, location: Location = Location(),
+    __slots__ = ('_velocity', '_max_velocity', '_damage', '_radius', 'color', '_rect',
+                 '_expire_tick', '_secondary_count', '_secondary_damage')
+
+    def __init__(self, x: float = 0, y: float = 0,
                  priority: int = 0,
                  *,
                  velocity: tuple[float, float] = (0, 0),
                  damage: int = 0,
                  secondary_count: int = 0):
-        super().__init__(location, priority)
+        super().__init__(Location(x, y), priority)
         self._velocity = velocity
         self._max_velocity = 3
         self._damage = damage
         self._radius = 15
         self.color = (125, 125, 125)
-        self._travel = 250
-        self._travel_dist = velocity[0] + velocity[1]
+        self._rect = Rect(int(x), int(y), self._radius, self._radius)
+        self._expire_tick = _expiry_tick(velocity)
         self._secondary_count = secondary_count
         self._secondary_damage = int(damage / 2)
 
@@ -135,41 +193,63 @@ class ShrapnelProjectile(Entity):
         self._velocity = value
 
     def tick(self, tick_count: int) -> None:
-        self.location.add(self._velocity[0], self._velocity[1])
-        collisions = self.nearby_entities_type(self._radius, Enemy)
-        if len(collisions) > 0:
-            self.on_collide(collisions[0])
-        self._travel -= self._travel_dist
-        if self._travel <= 0:
+        vx, vy = self._velocity
+        loc = self._loc
+        loc.x += vx
+        loc.y += vy
+        rect = self._rect
+        rect.x = int(loc.x)
+        rect.y = int(loc.y)
+        hit = engine.entity_handler.first_nearby(loc, self._radius, Enemy)
+        if hit is not None:
+            self.on_collide(hit)
+        elif tick_count >= self._expire_tick:
             self.on_collide(None)
 
     def draw(self, surface: Surface) -> None:
-        surface.fill(self.color, self.bounds())
+        surface.fill(self.color, self._rect)
 
     def bounds(self) -> Rect:
-        return self.location.as_rect(self._radius, self._radius)
+        return self._rect
 
     def on_collide(self, entity: LivingEntity | None):
         if entity is not None:
             entity.damage(self._damage)
 
-        for i in range(self._secondary_count):
-            x_velocity = 0
-            y_velocity = 0
-            while abs(x_velocity) + abs(y_velocity) < 5:
-                x_velocity = random.uniform(0, 5)
-                y_velocity = random.uniform(0, 5)
-                if random.randint(0, 1):
-                    x_velocity *= -1
-                if random.randint(0, 1):
-                    y_velocity *= -1
-
-            projectile_velocity = (x_velocity, y_velocity)
-
-            projectile = ShrapnelProjectileSecondary(location=self.location.copy(),
-                                                     velocity=projectile_velocity,
-                                                     damage=self._secondary_damage,
-                                                     priority=20 + i)
-            engine.entity_handler.register_entity(projectile)
-            projectile.spawn()
+        x, y = self.location.x, self.location.y
+        shards = [ShrapnelProjectileSecondary.acquire(x, y,
+                                                      velocity=velocity,
+                                                      damage=self._secondary_damage,
+                                                      priority=20 + i)
+                  for i, velocity in enumerate(_shard_velocities(self._secondary_count))]
+        engine.entity_handler.register_entities(*shards)
+        for shard in shards:
+            shard.spawn()
         self.dispose()
+
+    @classmethod
+    def acquire(cls, x: float, y: float, priority: int = 0, *,
+                velocity: tuple[float, float] = (0, 0),
+                damage: int = 0,
+                secondary_count: int = 0) -> 'ShrapnelProjectile':
+        """
+        Gets a projectile from the pool (or a new one), re-initialized with the given state.
+
+        :return: A ready-to-register ShrapnelProjectile.
+        """
+        projectile = _projectile_pool.acquire()
+        projectile._reset(Location(x, y), priority)
+        projectile._velocity = velocity
+        projectile._damage = damage
+        projectile._expire_tick = _expiry_tick(velocity)
+        projectile._secondary_count = secondary_count
+        projectile._secondary_damage = int(damage / 2)
+        projectile._rect.x = int(x)
+        projectile._rect.y = int(y)
+        return projectile
+
+    def _on_remove(self) -> None:
+        _projectile_pool.release(self)
+
+
+_projectile_pool: EntityPool[ShrapnelProjectile] = EntityPool(ShrapnelProjectile)
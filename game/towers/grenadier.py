@@ -5,6 +5,7 @@ from pygame import Surface, Rect
 import engine
 from engine.entity import Entity
 from engine.location import Location
+from engine.pool import EntityPool
 from game.board import Tower, Enemy, calculate_projectile_vel, EntityTargetType, TowerStage, TowerState, TEXTURE_PATH
 
 GREN_ASSETS = f'{TEXTURE_PATH}/shrap'
@@ -12,6 +13,8 @@ GREN_ASSETS = f'{TEXTURE_PATH}/shrap'
 
 class Grenadier(Tower):
 
+    __slots__ = ('_max_velocity', '_dmg_amt', '_upgrade_cost', '_aoe_radius')
+
     def __init__(self):
         super().__init__(scalar=3, ticks_per_frame=4)
         self.add_state(TowerState.IDLE, GREN_ASSETS, 1)
@@ -27,58 +30,42 @@ class Grenadier(Tower):
 
     def _on_ability(self, *args: Enemy) -> None:
         projectile_velocity = calculate_projectile_vel(self, random.choice(args), self._max_velocity)
-        projectile = GrenadierProjectile(location=self.location.copy(), velocity=projectile_velocity,
-                                         damage=self._dmg_amt, priority=20, aoe_radius=self._aoe_radius)
+        projectile = GrenadierProjectile.acquire(self.location.x, self.location.y, velocity=projectile_velocity,
+                                                 damage=self._dmg_amt, priority=20, aoe_radius=self._aoe_radius)
         engine.entity_handler.register_entity(projectile)
         projectile.spawn()
 
-    def entity_target(self) -> EntityTargetType:
-        return EntityTargetType.ENEMY
-
-    def _on_upgrade(self, stage: TowerStage) -> None:
-        match stage:
-            case TowerStage.STAGE_2:
-                self._dmg_amt = 40
-                self._health = 400
-                self._area_of_effect = 350
-                self._upgrade_cost = 250
-                self._aoe_radius = 60
-            case TowerStage.STAGE_3:
-                self._dmg_amt = 60
-                self._health = 500
-                self._area_of_effect = 425
-                self._regeneration_rate = 2
-                self._aoe_radius = 75
-
-    @property
-    def max_health(self) -> int:
-        return 300
+    entity_target = EntityTargetType.ENEMY
 
-    def _on_damage(self) -> None:
-        pass
+    _STAGE_STATS = {
+        TowerStage.STAGE_2: {'_dmg_amt': 40, '_health': 400, '_area_of_effect': 350, '_upgrade_cost': 250,
+                             '_aoe_radius': 60},
+        TowerStage.STAGE_3: {'_dmg_amt': 60, '_health': 500, '_area_of_effect': 425, '_regeneration_rate': 2,
+                             '_aoe_radius': 75},
+    }
 
-    def _on_heal(self) -> None:
-        pass
+    max_health = 300
 
-    def _on_death(self) -> None:
-        pass
 
 
 class GrenadierProjectile(Entity):
 
-    def __init__(self, location: Location = Location(),
+    __slots__ = ('_velocity', '_max_velocity', '_damage', '_radius', 'color', '_aoe_radius', '_rect')
+
+    def __init__(self, x: float = 0, y: float = 0,
                  priority: int = 0,
                  *,
                  velocity: tuple[float, float] = (0, 0),
                  damage: int = 0,
                  aoe_radius: int = 0):
-        super().__init__(location, priority)
+        super().__init__(Location(x, y), priority)
         self._velocity = velocity
         self._max_velocity = 5
         self._damage = damage
         self._radius = 6
         self.color = (50, 50, 50)
         self._aoe_radius = aoe_radius
+        self._rect = Rect(int(x), int(y), self._radius, self._radius)
 
     @property
     def velocity(self) -> tuple[float, float]:
@@ -89,19 +76,52 @@ class GrenadierProjectile(Entity):
         self._velocity = value
 
     def tick(self, tick_count: int) -> None:
-        self.location.add(self._velocity[0], self._velocity[1])
-        collisions = self.nearby_entities_type(self._radius, Enemy)
-        if len(collisions) > 0:
+        loc = self._loc
+        loc.x += self._velocity[0]
+        loc.y += self._velocity[1]
+        rect = self._rect
+        rect.x = int(loc.x)
+        rect.y = int(loc.y)
+        # collision at half rate; movement stays per-frame so no interpolation needed
+        if tick_count & 1:
+            return
+        if engine.entity_handler.first_nearby(loc, self._radius, Enemy) is not None:
             self.on_collide()
 
     def draw(self, surface: Surface) -> None:
-        surface.fill(self.color, self.bounds())
+        surface.fill(self.color, self._rect)
 
     def bounds(self) -> Rect:
-        return self.location.as_rect(self._radius, self._radius)
+        return self._rect
 
     def on_collide(self):
-        enemies = self.nearby_entities_type(self._aoe_radius, Enemy)
-        for enemy in enemies:
-            enemy.damage(self._damage)
+        engine.entity_handler.apply_nearby(self._loc, self._aoe_radius, Enemy, self._damage_enemy)
         self.dispose()
+
+    def _damage_enemy(self, enemy: Enemy) -> None:
+        enemy.damage(self._damage)
+
+    @classmethod
+    def acquire(cls, x: float, y: float, priority: int = 0, *,
+                velocity: tuple[float, float] = (0, 0),
+                damage: int = 0,
+                aoe_radius: int = 0) -> 'GrenadierProjectile':
+        """
+        Gets a grenade from the pool (or a new one), re-initialized with the given state.
+
+        :return: A ready-to-register GrenadierProjectile.
+        """
+        projectile = _projectile_pool.acquire()
+        projectile._reset(Location(x, y), priority)
+        projectile._velocity = velocity
+        projectile._damage = damage
+        projectile._aoe_radius = aoe_radius
+        projectile._rect.x = int(x)
+        projectile._rect.y = int(y)
+        return projectile
+
+    def _on_remove(self) -> None:
+        _projectile_pool.release(self)
+
+
+_projectile_pool: EntityPool[GrenadierProjectile] = EntityPool(GrenadierProjectile)
@@ -4,6 +4,7 @@ from pygame import Surface, Rect
 import engine
 from engine.entity import Entity
 from engine.location import Location
+from engine.pool import EntityPool
 from game.board import Enemy, EntityTargetType, Tower, TowerStage, calculate_projectile_vel, TEXTURE_PATH, TowerState
 
 HEALER_ASSETS = f'{TEXTURE_PATH}/h1'
@@ -11,6 +12,8 @@ HEALER_ASSETS = f'{TEXTURE_PATH}/h1'
 
 class Healer(Tower):
 
+    __slots__ = ('_upgrade_cost', '_detect_range', '_life_span', '_projectile_health', '_healing_rate')
+
     def __init__(self):
         super().__init__(scalar=0.7, ticks_per_frame=4)
         self.add_state(TowerState.IDLE, HEALER_ASSETS, 1)
@@ -26,48 +29,31 @@ class Healer(Tower):
         self._healing_rate = 10
 
     def _on_ability(self, *args: Enemy) -> None:
-        projectile = HealerProjectile(location=self.location.copy(), velocity=(0, 0), health=self._projectile_health,
-                                      healing_rate=self._healing_rate, priority=20, detect_range=self._detect_range,
-                                      life_span=self._life_span)
+        projectile = HealerProjectile.acquire(self.location.x, self.location.y, health=self._projectile_health,
+                                              healing_rate=self._healing_rate, priority=20,
+                                              detect_range=self._detect_range, life_span=self._life_span)
         engine.entity_handler.register_entity(projectile)
         projectile.spawn()
 
-    def entity_target(self) -> EntityTargetType:
-        return EntityTargetType.NONE
-
-    def _on_upgrade(self, stage: TowerStage) -> None:
-        match stage:
-            case TowerStage.STAGE_2:
-                self._health = 400
-                self._upgrade_cost = 80
-                self._detect_range = 130
-                self._life_span = 11
-                self._projectile_health = 60
-                self._healing_rate = 15
-            case TowerStage.STAGE_3:
-                self._health = 500
-                self._detect_range = 150
-                self._life_span = 12
-                self._projectile_health = 100
-                self._healing_rate = 25
-
-    @property
-    def max_health(self) -> int:
-        return 300
+    entity_target = EntityTargetType.NONE
 
-    def _on_damage(self) -> None:
-        pass
+    _STAGE_STATS = {
+        TowerStage.STAGE_2: {'_health': 400, '_upgrade_cost': 80, '_detect_range': 130, '_life_span': 11,
+                             '_projectile_health': 60, '_healing_rate': 15},
+        TowerStage.STAGE_3: {'_health': 500, '_detect_range': 150, '_life_span': 12, '_projectile_health': 100,
+                             '_healing_rate': 25},
+    }
 
-    def _on_heal(self) -> None:
-        pass
+    max_health = 300
 
-    def _on_death(self) -> None:
-        pass
 
 
 class HealerProjectile(Entity):
 
-    def __init__(self, location: Location = Location(),
+    __slots__ = ('_velocity', '_max_velocity', '_health', '_healing_rate', '_radius', 'color',
+                 'detect_range', 'target', 'on_target', '_life_span', '_rect')
+
+    def __init__(self, x: float = 0, y: float = 0,
                  priority: int = 0,
                  *,
                  velocity: tuple[float, float] = (0, 0),
@@ -75,7 +61,7 @@ class HealerProjectile(Entity):
                  healing_rate: int = 0,
                  detect_range: int = 0,
                  life_span: float = 0):
-        super().__init__(location, priority)
+        super().__init__(Location(x, y), priority)
         self._velocity = velocity
         self._max_velocity = 5
         self._health = health
@@ -86,6 +72,7 @@ class HealerProjectile(Entity):
         self.target = None
         self.on_target = False
         self._life_span = round(life_span * engine.window.fps)
+        self._rect = Rect(int(x), int(y), self._radius, self._radius)
 
     @property
     def velocity(self) -> tuple[float, float]:
@@ -97,17 +84,23 @@ class HealerProjectile(Entity):
 
     def tick(self, tick_count: int) -> None:
         if self.target is None:
-            towers = self.nearby_entities_type(self.detect_range, Tower)
-            min_tower_health = 100000
-            for tower in towers:
-                if min_tower_health > tower.health > 0:
-                    self.target = tower
-                    min_tower_health = tower.health
+            # unassigned orbs re-scan at most every 10 ticks; the roster of hurt
+            # towers doesn't change frame to frame
+            if tick_count % 10 == 0:
+                towers = [t for t in engine.entity_handler.query_nearby(self._loc, self.detect_range, Tower)
+                          if t.health > 0]
+                if towers:
+                    self.target = min(towers, key=lambda t: t.health)
+                    # towers don't move; one velocity at acquisition serves the whole flight
+                    self._velocity = calculate_projectile_vel(self, self.target, 5)
         elif not self.on_target:
-            self.velocity = calculate_projectile_vel(self, self.target, 5)
-            self.location.add(self._velocity[0], self._velocity[1])
-            collisions = self.nearby_entities_type(self._radius, Tower)
-            if self.target in collisions:
+            loc = self._loc
+            loc.x += self._velocity[0]
+            loc.y += self._velocity[1]
+            rect = self._rect
+            rect.x = int(loc.x)
+            rect.y = int(loc.y)
+            if self.location.dist_sqr(self.target.location) <= self._radius * self._radius:
                 self.velocity = (0, 0)
                 self.on_target = True
         if self.on_target:
@@ -119,13 +112,43 @@ class HealerProjectile(Entity):
             self._life_span -= 1
 
     def draw(self, surface: Surface) -> None:
-        surface.fill(self.color, self.bounds())
+        surface.fill(self.color, self._rect)
 
     def bounds(self) -> Rect:
-        return self.location.as_rect(self._radius, self._radius)
+        return self._rect
 
     def on_collide(self):
         self.target.heal(min(self._healing_rate, self._health))
         self._health -= self._healing_rate
         if self._health <= 0:
             self.dispose()
+
+    @classmethod
+    def acquire(cls, x: float, y: float, priority: int = 0, *,
+                health: int = 0,
+                healing_rate: int = 0,
+                detect_range: int = 0,
+                life_span: float = 0) -> 'HealerProjectile':
+        """
+        Gets a healing orb from the pool (or a new one), re-initialized with the given state.
+
+        :return: A ready-to-register HealerProjectile.
+        """
+        projectile = _projectile_pool.acquire()
+        projectile._reset(Location(x, y), priority)
+        projectile._velocity = (0, 0)
+        projectile._health = health
+        projectile._healing_rate = healing_rate
+        projectile.detect_range = detect_range
+        projectile.target = None
+        projectile.on_target = False
+        projectile._life_span = round(life_span * engine.window.fps)
+        projectile._rect.x = int(x)
+        projectile._rect.y = int(y)
+        return projectile
+
+    def _on_remove(self) -> None:
+        _projectile_pool.release(self)
+
+
+_projectile_pool: EntityPool[HealerProjectile] = EntityPool(HealerProjectile)
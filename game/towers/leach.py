@@ -5,9 +5,14 @@ from game.constants import TEXTURE_PATH
 
 LEACH_ASSET = f'{TEXTURE_PATH}/tower/leach'
 
+# Shared RNG instance; bound-method calls skip the module-level indirection.
+_rand = random.Random()
+
 
 class Leach(Tower):
 
+    __slots__ = ('_dmg_amt', '_upgrade_cost', '_healing', '_aoe_radius')
+
     def __init__(self):
         super().__init__(scalar=3, ticks_per_frame=4)
         self.add_state(TowerState.IDLE, LEACH_ASSET, 1)
@@ -22,37 +27,24 @@ class Leach(Tower):
         self._aoe_radius = 80
 
     def _on_ability(self, *args: Enemy) -> None:
-        targets = random.choice(args).nearby_entities_type(self._aoe_radius, Enemy)
+        # single in-range enemy is the common case; skip the RNG entirely then
+        pivot = args[0] if len(args) == 1 else _rand.choice(args)
+        targets = pivot.nearby_entities_type(self._aoe_radius, Enemy)
+        if not targets:
+            return
+        dmg_amt = self._dmg_amt
         for target in targets:
-            target.damage(self._dmg_amt)
-            self.heal(self._healing)
-
-    def entity_target(self) -> EntityTargetType:
-        return EntityTargetType.ENEMY
-
-    def _on_upgrade(self, stage: TowerStage) -> None:
-        match stage:
-            case TowerStage.STAGE_2:
-                self._dmg_amt = 25
-                self._health = 250
-                self._area_of_effect = 200
-                self._upgrade_cost = 120
-                self._healing = 7.5
-            case TowerStage.STAGE_3:
-                self._dmg_amt = 30
-                self._health = 300
-                self._area_of_effect = 250
-                self._healing = 10
-
-    @property
-    def max_health(self) -> int:
-        return 200
-
-    def _on_damage(self) -> None:
-        pass
-
-    def _on_heal(self) -> None:
-        pass
-
-    def _on_death(self) -> None:
-        pass
+            target.damage(dmg_amt)
+        # health clamps the same whether applied per hit or in aggregate
+        self.heal(len(targets) * self._healing)
+
+    entity_target = EntityTargetType.ENEMY
+
+    _STAGE_STATS = {
+        TowerStage.STAGE_2: {'_dmg_amt': 25, '_health': 250, '_area_of_effect': 200, '_upgrade_cost': 120,
+                             '_healing': 7.5},
+        TowerStage.STAGE_3: {'_dmg_amt': 30, '_health': 300, '_area_of_effect': 250, '_healing': 10},
+    }
+
+    max_health = 200
+
@@ -5,14 +5,21 @@ from pygame import Surface, Rect
 import engine
 from engine.entity import Entity
 from engine.location import Location
+from engine.pool import EntityPool
 from game.board import Tower, Enemy, EntityTargetType, TowerStage, TowerState
 from game.constants import TEXTURE_PATH
 
 MINE_ASSETS = f'{TEXTURE_PATH}/tower/h2'
 
+# Shared RNG instance; calling its bound methods skips the module-level indirection
+# and `getrandbits(1)` is a much cheaper coin flip than `randint(0, 1)`.
+_rand = random.Random()
+
 
 class Minefield(Tower):
 
+    __slots__ = ('_max_velocity', '_dmg_amt', '_upgrade_cost', '_lifespan', '_aoe_radius')
+
     def __init__(self):
         super().__init__(scalar=0.6, ticks_per_frame=4)
         self.add_state(TowerState.IDLE, MINE_ASSETS, 1)
@@ -29,71 +36,53 @@ class Minefield(Tower):
         self._aoe_radius = 100
 
     def _on_ability(self, *args: Enemy) -> None:
-        velocity_seed = random.uniform(0, self._max_velocity)
-        x_mod = 1
-        y_mod = 1
-        if random.randint(0, 1):
-            x_mod *= -1
-        if random.randint(0, 1):
-            y_mod *= -1
+        velocity_seed = _rand.random() * self._max_velocity
+        # one 2-bit draw, branchless: bit 0 -> +/-1 on x, bit 1 -> +/-1 on y
+        bits = _rand.getrandbits(2)
+        x_mod = 1 - ((bits & 1) << 1)
+        y_mod = 1 - (bits & 2)
         projectile_velocity = (velocity_seed * x_mod, (5 - velocity_seed) * y_mod)
-        projectile = MinefieldProjectile(location=self.location.copy(), velocity=projectile_velocity,
-                                         damage=self._dmg_amt, priority=20, aoe_radius=self._aoe_radius,
-                                         life_span=self._lifespan)
+        projectile = MinefieldProjectile.acquire(self.location.x, self.location.y, velocity=projectile_velocity,
+                                                 damage=self._dmg_amt, priority=20, aoe_radius=self._aoe_radius,
+                                                 life_span=self._lifespan)
         engine.entity_handler.register_entity(projectile)
         projectile.spawn()
 
-    def entity_target(self) -> EntityTargetType:
-        return EntityTargetType.NONE
-
-    def _on_upgrade(self, stage: TowerStage) -> None:
-        match stage:
-            case TowerStage.STAGE_2:
-                self._dmg_amt = 45
-                self._health = 400
-                self._area_of_effect = 125
-                self._upgrade_cost = 100
-                self._lifespan = 7
-                self._aoe_radius = 110
-            case TowerStage.STAGE_3:
-                self._dmg_amt = 70
-                self._health = 450
-                self._area_of_effect = 150
-                self._lifespan = 10
-                self._aoe_radius = 115
-
-    @property
-    def max_health(self) -> int:
-        return 300
+    entity_target = EntityTargetType.NONE
 
-    def _on_damage(self) -> None:
-        pass
+    _STAGE_STATS = {
+        TowerStage.STAGE_2: {'_dmg_amt': 45, '_health': 400, '_area_of_effect': 125, '_upgrade_cost': 100,
+                             '_lifespan': 7, '_aoe_radius': 110},
+        TowerStage.STAGE_3: {'_dmg_amt': 70, '_health': 450, '_area_of_effect': 150, '_lifespan': 10,
+                             '_aoe_radius': 115},
+    }
 
-    def _on_heal(self) -> None:
-        pass
+    max_health = 300
 
-    def _on_death(self) -> None:
-        pass
 
 
 class MinefieldProjectile(Entity):
 
-    def __init__(self, location: Location = Location(),
+    __slots__ = ('_velocity', '_max_velocity', 'damage', '_radius', 'color', 'travel_time',
+                 '_aoe_radius', '_life_span', '_rect')
+
+    def __init__(self, x: float = 0, y: float = 0,
                  priority: int = 0,
                  *,
                  velocity: tuple[float, float] = (0, 0),
                  damage: int = 0,
                  aoe_radius: int = 0,
                  life_span: float = 0):
-        super().__init__(location, priority)
+        super().__init__(Location(x, y), priority)
         self._velocity = velocity
         self._max_velocity = 5
         self.damage = damage
         self._radius = 10
         self.color = (0, 0, 0)
-        self.travel_time = random.randint(15, 25)
+        self.travel_time = _rand.randint(15, 25)
         self._aoe_radius = aoe_radius
         self._life_span = round(life_span * engine.window.fps)
+        self._rect = Rect(int(x), int(y), self._radius, self._radius)
 
     @property
     def velocity(self) -> tuple[float, float]:
@@ -106,23 +95,55 @@ class MinefieldProjectile(Entity):
     def tick(self, tick_count: int) -> None:
         if self.travel_time >= 0:
             self.travel_time -= 1
-            self.location.add(self._velocity[0], self._velocity[1])
+            loc = self._loc
+            loc.x += self._velocity[0]
+            loc.y += self._velocity[1]
+            rect = self._rect
+            rect.x = int(loc.x)
+            rect.y = int(loc.y)
 
         if self._life_span <= 0:
             self.on_collide()
         else:
             self._life_span -= 1
 
-        collisions = self.nearby_entities_type(self._radius, Enemy)
-        if len(collisions) > 0:
+        if engine.entity_handler.first_nearby(self._loc, self._radius, Enemy) is not None:
             self.on_collide()
 
     def draw(self, surface: Surface) -> None:
-        surface.fill(self.color, self.bounds())
+        surface.fill(self.color, self._rect)
 
     def bounds(self) -> Rect:
-        return self.location.as_rect(self._radius, self._radius)
+        return self._rect
 
     def on_collide(self):
-        enemies = self.nearby_entities_type(self._aoe_radius, Enemy)
+        enemies = engine.entity_handler.query_nearby(self._loc, self._aoe_radius, Enemy)
         self.dispose()
+
+    @classmethod
+    def acquire(cls, x: float, y: float, priority: int = 0, *,
+                velocity: tuple[float, float] = (0, 0),
+                damage: int = 0,
+                aoe_radius: int = 0,
+                life_span: float = 0) -> 'MinefieldProjectile':
+        """
+        Gets a mine from the pool (or a new one), re-initialized with the given state.
+
+        :return: A ready-to-register MinefieldProjectile.
+        """
+        projectile = _projectile_pool.acquire()
+        projectile._reset(Location(x, y), priority)
+        projectile._velocity = velocity
+        projectile.damage = damage
+        projectile.travel_time = _rand.randint(15, 25)
+        projectile._aoe_radius = aoe_radius
+        projectile._life_span = round(life_span * engine.window.fps)
+        projectile._rect.x = int(x)
+        projectile._rect.y = int(y)
+        return projectile
+
+    def _on_remove(self) -> None:
+        _projectile_pool.release(self)
+
+
+_projectile_pool: EntityPool[MinefieldProjectile] = EntityPool(MinefieldProjectile)
@@ -1,5 +1,3 @@
-import random
-
 from game.board import Tower, Enemy, EntityTargetType, TowerStage, TowerState
 from game.constants import TEXTURE_PATH
 
@@ -8,6 +6,8 @@ SNIPER_ASSETS = f'{TEXTURE_PATH}/tower/snipe'
 
 class Sniper(Tower):
 
+    __slots__ = ('_dmg_amt', '_upgrade_cost')
+
     def __init__(self):
         super().__init__(scalar=3, ticks_per_frame=4)
         self.add_state(TowerState.IDLE, SNIPER_ASSETS, 1)
@@ -20,34 +20,18 @@ class Sniper(Tower):
         self._area_of_effect = 400
 
     def _on_ability(self, *args: Enemy) -> None:
-        random.choice(args).damage(self._dmg_amt)
-
-    def entity_target(self) -> EntityTargetType:
-        return EntityTargetType.ENEMY
-
-    def _on_upgrade(self, stage: TowerStage) -> None:
-        match stage:
-            case TowerStage.STAGE_2:
-                self._dmg_amt = 300
-                self._health = 300
-                self._area_of_effect = 500
-                self._regeneration_rate = 0
-                self._upgrade_cost = 100
-            case TowerStage.STAGE_3:
-                self._dmg_amt = 450
-                self._health = 400
-                self._area_of_effect = 600
-                self._regeneration_rate = 0
-
-    @property
-    def max_health(self) -> int:
-        return 250
-
-    def _on_damage(self) -> None:
-        pass
-
-    def _on_heal(self) -> None:
-        pass
-
-    def _on_death(self) -> None:
-        pass
+        args[0].damage(self._dmg_amt)
+
+    entity_target = EntityTargetType.ENEMY
+
+    def single_target(self) -> bool:
+        return True
+
+    _STAGE_STATS = {
+        TowerStage.STAGE_2: {'_dmg_amt': 300, '_health': 300, '_area_of_effect': 500, '_regeneration_rate': 0,
+                             '_upgrade_cost': 100},
+        TowerStage.STAGE_3: {'_dmg_amt': 450, '_health': 400, '_area_of_effect': 600, '_regeneration_rate': 0},
+    }
+
+    max_health = 250
+